@@ -7,38 +7,79 @@ It includes functions for:
 - Opening files in a directory and reading their content.
 """
 
+import binascii
 import os
+import sys
+from array import array
+from typing import Optional
 
 
-def read_file(path: str) -> tuple[list[int], int]:
+def read_file(path: str) -> tuple[array, int]:
     """Reads a file and returns its content and the number of lines.
 
+    The words are stored in a compact `array('I')` rather than a list of
+    Python integers, so large images take 4 bytes per word in memory.
+
     Args:
         path (str): Path to the file.
 
     Returns:
-        tuple[list[int], int]: Tuple with the file content (as integers) and the number of lines.
+        tuple[array, int]: Tuple with the file content (as 32-bit integers) and the number of lines.
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        ValueError: If a line in the file cannot be converted to an integer.
+        ValueError: If a line in the file cannot be converted to a 32-bit
+        integer.
     """
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Error: The file '{path}' was not found.")
 
-    data = []
-    with open(path, 'r', encoding='utf-8') as file:
-        for line in file:
-            try:
-                data.append(int(line.strip(), 16))
-            except ValueError as e:
-                raise ValueError(
-                    f'Error converting line to integer: {e}'
-                ) from e
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    data = _parse_fixed_width(content)
+    if data is not None:
+        return data, len(data)
+
+    lines = content.decode('utf-8').splitlines()
+    try:
+        data = array('I', [int(line, 16) for line in lines])
+    except ValueError as e:
+        raise ValueError(f'Error converting line to integer: {e}') from e
+    except OverflowError as e:
+        raise ValueError(f'Value does not fit in 32 bits: {e}') from e
 
     return data, len(data)
 
 
+def _parse_fixed_width(content: bytes) -> Optional[array]:
+    """Parses a file where every line holds exactly one 32-bit hex word.
+
+    The whole content is decoded by `binascii` straight into the array's
+    buffer, without creating a Python integer per line.
+
+    Args:
+        content (bytes): Raw file content.
+
+    Returns:
+        Optional[array]: The parsed words, or `None` if the content is not in
+        the fixed-width format.
+    """
+    lines = content.splitlines()
+    if not lines or set(map(len, lines)) != {8}:
+        return None
+
+    try:
+        raw = binascii.unhexlify(b''.join(lines))
+    except binascii.Error:
+        return None
+
+    data = array('I', raw)
+    if sys.byteorder == 'little':
+        data.byteswap()
+    return data
+
+
 def list_files_in_dir(path: str) -> list[str]:
     """List all files in a directory.
 
@@ -58,11 +99,8 @@ def list_files_in_dir(path: str) -> list[str]:
         )
 
     try:
-        return [
-            file
-            for file in os.listdir(path)
-            if os.path.isfile(os.path.join(path, file))
-        ]
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
     except OSError as e:
         raise OSError(f'Error accessing the directory: {e}') from e
 
@@ -87,14 +125,14 @@ def open_files_in_dir(path: str) -> list[dict[str, list[str]]]:
 
     files_content = []
     try:
-        for file_name in os.listdir(path):
-            file_path = os.path.join(path, file_name)
-            if os.path.isfile(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_data = f.readlines()
-                files_content.append(
-                    {file_name: [line.strip() for line in file_data]}
-                )
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        file_data = f.read().splitlines()
+                    files_content.append(
+                        {entry.name: [line.strip() for line in file_data]}
+                    )
     except OSError as e:
         raise OSError(f'Error processing files in the directory: {e}') from e
 
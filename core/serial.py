@@ -5,9 +5,79 @@ This module contains the `ProcessorCIInterface` class, which implements methods
 to control and interact with a processor by sending commands via a serial interface.
 """
 
-import time
+import binascii
+import os
+import selectors
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Iterator, Optional, Union
+
 import serial
 
+_CMD_STRUCT = struct.Struct('>I')
+_RAW_STRUCT = _CMD_STRUCT
+
+# Number of words packed per struct call when building bulk transfers.
+_BULK_CHUNK_WORDS = 4096
+
+# Most buffers a single `os.writev` call accepts.
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    # _XOPEN_IOV_MAX, the smallest limit POSIX allows.
+    _IOV_MAX = 16
+
+
+class Opcode(IntEnum):
+    """
+    Operation codes understood by the ProcessorCI controller.
+    """
+
+    SEND_CLK = 0x43
+    STOP_CLK = 0x53
+    RESUME_CLK = 0x72
+    RESET_CORE = 0x52
+    WRITE_MEMORY = 0x57
+    READ_MEMORY = 0x4C
+    LOAD_MSB_ACCUMULATOR = 0x55
+    LOAD_LSB_ACCUMULATOR = 0x6C
+    ADD_TO_ACCUMULATOR = 0x41
+    WRITE_ACCUMULATOR_TO_MEMORY = 0x77
+    WRITE_TO_ACCUMULATOR = 0x73
+    READ_ACCUMULATOR = 0x72
+    SET_TIMEOUT = 0x54
+    SET_MEMORY_PAGE_SIZE = 0x50
+    RUN_MEMORY_TESTS = 0x45
+    GET_MODULE_ID = 0x70
+    SET_EXECUTION_END_ADDRESS = 0x44
+    SET_ACCUMULATOR_AS_END_ADDRESS = 0x64
+    WRITE_FROM_ACCUMULATOR = 0x65
+    READ_FROM_ACCUMULATOR = 0x62
+    GET_ACCUMULATOR_VALUE = 0x61
+    CHANGE_MEMORY_ACCESS_PRIORITY = 0x4F
+    EXECUTE_UNTIL_STOP = 0x75
+
+
+# Frames of the commands whose immediate is always zero, packed once.
+_FRAME_STOP_CLK = _CMD_STRUCT.pack(Opcode.STOP_CLK)
+_FRAME_RESUME_CLK = _CMD_STRUCT.pack(Opcode.RESUME_CLK)
+_FRAME_RESET_CORE = _CMD_STRUCT.pack(Opcode.RESET_CORE)
+_FRAME_READ_ACCUMULATOR = _CMD_STRUCT.pack(Opcode.READ_ACCUMULATOR)
+_FRAME_GET_MODULE_ID = _CMD_STRUCT.pack(Opcode.GET_MODULE_ID)
+_FRAME_SET_ACCUMULATOR_AS_END_ADDRESS = _CMD_STRUCT.pack(
+    Opcode.SET_ACCUMULATOR_AS_END_ADDRESS
+)
+_FRAME_GET_ACCUMULATOR_VALUE = _CMD_STRUCT.pack(Opcode.GET_ACCUMULATOR_VALUE)
+_FRAME_CHANGE_MEMORY_ACCESS_PRIORITY = _CMD_STRUCT.pack(
+    Opcode.CHANGE_MEMORY_ACCESS_PRIORITY
+)
+_FRAME_EXECUTE_UNTIL_STOP = _CMD_STRUCT.pack(Opcode.EXECUTE_UNTIL_STOP)
+
 
 class ProcessorCIInterface:
     """
@@ -17,6 +87,16 @@ class ProcessorCIInterface:
     and executing operations on a processor connected via a serial interface.
     """
 
+    __slots__ = (
+        'port',
+        'baudrate',
+        'serial',
+        '_tx_queue',
+        '_batching',
+        '_frame',
+        '_selector',
+    )
+
     def __init__(self, port: str, baudrate: int, timeout: int = 1) -> None:
         """
         Initializes the serial interface with the provided parameters.
@@ -31,15 +111,91 @@ class ProcessorCIInterface:
         self.serial = serial.Serial(port, baudrate, timeout=timeout)
         self.serial.flushInput()
         self.serial.flushOutput()
+        self._tx_queue: list[bytes] = []
+        self._batching = 0
+        self._frame = bytearray(_CMD_STRUCT.size)
+        self._selector: Optional[selectors.BaseSelector] = None
 
     def _send_data(self, data: bytes) -> None:
         """
         Sends data through the serial port.
 
+        Inside a `batched()` block the data is queued and only written when
+        the outermost block exits.
+
         Args:
             data (bytes): Data to be sent.
         """
-        self.serial.write(data)
+        if self._batching:
+            self._tx_queue.append(bytes(data))
+        else:
+            self.serial.write(data)
+
+    def _writev(self, buffers: list[bytes]) -> None:
+        """
+        Sends several buffers through the serial port as one write.
+
+        On POSIX the buffers are handed to the kernel with `os.writev`, at most
+        `_IOV_MAX` at a time, avoiding the copy needed to concatenate them.
+        Any part the kernel does not accept right away is sent with a regular
+        serial write. Inside a `batched()` block the buffers are queued
+        without being copied.
+
+        Args:
+            buffers (list[bytes]): Buffers to be sent, in order.
+
+        Raises:
+            serial.SerialException: If the port rejects the write.
+        """
+        if self._batching:
+            self._tx_queue.extend(buffers)
+            return
+
+        if not hasattr(os, 'writev'):
+            self.serial.write(b''.join(buffers))
+            return
+
+        for start in range(0, len(buffers), _IOV_MAX):
+            group = buffers[start : start + _IOV_MAX]
+            try:
+                written = os.writev(self.serial.fileno(), group)
+            except BlockingIOError:
+                written = 0
+            except OSError as e:
+                raise serial.SerialException(f'write failed: {e}') from e
+
+            for buffer in group:
+                view = memoryview(buffer).cast('B')
+                if written >= view.nbytes:
+                    written -= view.nbytes
+                    continue
+                self.serial.write(view[written:])
+                written = 0
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """
+        Groups every command sent inside the block into a single serial write.
+
+        Blocks can be nested; the queued data is flushed once the outermost
+        block exits. If a block raises, the data queued inside it is
+        discarded, even when an enclosing block catches the exception, so no
+        partial command reaches the processor.
+        """
+        mark = len(self._tx_queue)
+        self._batching += 1
+        try:
+            yield
+        except BaseException:
+            del self._tx_queue[mark:]
+            raise
+        finally:
+            self._batching -= 1
+
+        if not self._batching and self._tx_queue:
+            buffers = self._tx_queue
+            self._tx_queue = []
+            self._writev(buffers)
 
     def read_data(self, size: int = 4) -> bytes:
         """
@@ -53,16 +209,49 @@ class ProcessorCIInterface:
         """
         return self.serial.read(size)
 
-    def print_data(self, data: int) -> None:
+    def _wait_read(self, size: int) -> bytes:
+        """
+        Blocks until the processor answers, then reads the reply.
+
+        The wait is done by the operating system on the port's file
+        descriptor, so it returns as soon as the first byte arrives. Ports
+        without a pollable descriptor fall back to a plain blocking read.
+
+        Args:
+            size (int): Number of bytes to read.
+
+        Returns:
+            bytes: Data read from the serial port.
+        """
+        if self._selector is None:
+            selector = selectors.DefaultSelector()
+            try:
+                selector.register(self.serial.fileno(), selectors.EVENT_READ)
+            except (OSError, ValueError):
+                selector.close()
+                timeout = self.serial.timeout
+                self.serial.timeout = None
+                try:
+                    return self.serial.read(size)
+                finally:
+                    self.serial.timeout = timeout
+            self._selector = selector
+
+        if not self.data_available():
+            self._selector.select()
+        return self.serial.read(size)
+
+    def print_data(self, data: bytes) -> None:
         """
         Prints the received data in hexadecimal format.
 
         Args:
-            data (int): Data to be printed.
+            data (bytes): Data to be printed.
         """
-        for byte in data:
-            print(f'{byte:02x}', end='')
-        print()
+        if isinstance(data, int):
+            sys.stdout.write(f'{data:x}\n')
+        else:
+            sys.stdout.write(binascii.hexlify(data).decode('ascii') + '\n')
 
     def data_available(self) -> bool:
         """
@@ -77,6 +266,8 @@ class ProcessorCIInterface:
         """
         Closes the serial connection.
         """
+        if self._selector is not None:
+            self._selector.close()
         self.serial.close()
 
     def _send_command(self, opcode: int, immediate: int) -> None:
@@ -87,11 +278,10 @@ class ProcessorCIInterface:
             opcode (int): Operation code.
             immediate (int): Immediate value to send with the command.
         """
-        opcode = opcode & 0xFF
-        immediate = immediate << 8
-        data = opcode | immediate
-        data = data.to_bytes(4, 'big')
-        self._send_data(data)
+        _CMD_STRUCT.pack_into(
+            self._frame, 0, ((immediate & 0xFFFFFF) << 8) | (opcode & 0xFF)
+        )
+        self._send_data(self._frame)
 
     def send_rawdata(self, data: int) -> None:
         """
@@ -100,8 +290,8 @@ class ProcessorCIInterface:
         Args:
             data (int): Data to be sent.
         """
-        data = data.to_bytes(4, 'big')
-        self._send_data(data)
+        _RAW_STRUCT.pack_into(self._frame, 0, data)
+        self._send_data(self._frame)
 
     def send_clk_pulses(self, n: int) -> None:
         """
@@ -110,25 +300,25 @@ class ProcessorCIInterface:
         Args:
             n (int): Number of clock pulses to send.
         """
-        self._send_command(0x43, n)
+        self._send_command(Opcode.SEND_CLK, n)
 
     def stop_clk(self) -> None:
         """
         Stops the processor clock.
         """
-        self._send_command(0x53, 0)
+        self._send_data(_FRAME_STOP_CLK)
 
     def resume_clk(self) -> None:
         """
         Resumes the processor clock.
         """
-        self._send_command(0x72, 0)
+        self._send_data(_FRAME_RESUME_CLK)
 
     def reset_core(self) -> None:
         """
         Resets the processor core.
         """
-        self._send_command(0x52, 0)
+        self._send_data(_FRAME_RESET_CORE)
 
     def write_memory(
         self, address: int, value: int, second_memory: bool = False
@@ -144,8 +334,9 @@ class ProcessorCIInterface:
         address = address >> 2
         if second_memory:
             address = address | 0x800000
-        self._send_command(0x57, address)
-        self.send_rawdata(value)
+        with self.batched():
+            self._send_command(Opcode.WRITE_MEMORY, address)
+            self.send_rawdata(value)
 
     def read_memory(self, address: int, second_memory: bool = False) -> bytes:
         """
@@ -162,7 +353,7 @@ class ProcessorCIInterface:
         if second_memory:
             address = address & 0xFFFFFF
             address = address | 0x800000
-        self._send_command(0x4C, address)
+        self._send_command(Opcode.READ_MEMORY, address)
         return self.read_data()
 
     def load_msb_accumulator(self, value: int) -> None:
@@ -172,7 +363,7 @@ class ProcessorCIInterface:
         Args:
             value (int): Value to load into the MSB of the accumulator.
         """
-        self._send_command(0x55, value)
+        self._send_command(Opcode.LOAD_MSB_ACCUMULATOR, value)
 
     def load_lsb_accumulator(self, value: int) -> None:
         """
@@ -181,7 +372,7 @@ class ProcessorCIInterface:
         Args:
             value (int): Value to load into the LSB of the accumulator.
         """
-        self._send_command(0x6C, value & 0xFF)
+        self._send_command(Opcode.LOAD_LSB_ACCUMULATOR, value & 0xFF)
 
     def add_to_accumulator(self, value: int) -> None:
         """
@@ -190,7 +381,7 @@ class ProcessorCIInterface:
         Args:
             value (int): Value to add to the accumulator.
         """
-        self._send_command(0x41, value)
+        self._send_command(Opcode.ADD_TO_ACCUMULATOR, value)
 
     def write_accumulator_to_memory(self, address: int) -> None:
         """
@@ -199,7 +390,7 @@ class ProcessorCIInterface:
         Args:
             address (int): Memory address where the accumulator value will be written.
         """
-        self._send_command(0x77, address)
+        self._send_command(Opcode.WRITE_ACCUMULATOR_TO_MEMORY, address)
 
     def write_to_accumulator(self, value: int) -> None:
         """
@@ -208,7 +399,7 @@ class ProcessorCIInterface:
         Args:
             value (int): Value to write into the accumulator.
         """
-        self._send_command(0x73, value)
+        self._send_command(Opcode.WRITE_TO_ACCUMULATOR, value)
 
     def read_accumulator(self) -> int:
         """
@@ -217,7 +408,7 @@ class ProcessorCIInterface:
         Returns:
             int: Value of the accumulator.
         """
-        self._send_command(0x72, 0)
+        self._send_data(_FRAME_READ_ACCUMULATOR)
         return self.read_data()
 
     def set_timeout(self, timeout: int) -> None:
@@ -227,7 +418,7 @@ class ProcessorCIInterface:
         Args:
             timeout (int): Timeout value in seconds.
         """
-        self._send_command(0x54, timeout)
+        self._send_command(Opcode.SET_TIMEOUT, timeout)
 
     def set_memory_page_size(self, size: int) -> None:
         """
@@ -236,7 +427,7 @@ class ProcessorCIInterface:
         Args:
             size (int): Size of the memory page in bytes.
         """
-        self._send_command(0x50, size)
+        self._send_command(Opcode.SET_MEMORY_PAGE_SIZE, size)
 
     def run_memory_tests(
         self,
@@ -261,12 +452,9 @@ class ProcessorCIInterface:
         if timeout != -1:
             self.set_timeout(timeout)
 
-        self._send_command(0x45, number_of_pages)
+        self._send_command(Opcode.RUN_MEMORY_TESTS, number_of_pages)
 
-        while not self.data_available():
-            time.sleep(0.1)
-
-        return self.read_data()
+        return self._wait_read(4)
 
     def get_module_id(self) -> int:
         """
@@ -275,7 +463,7 @@ class ProcessorCIInterface:
         Returns:
             int: Module ID as received from the processor.
         """
-        self._send_command(0x70, 0)
+        self._send_data(_FRAME_GET_MODULE_ID)
         return self.read_data()
 
     def set_execution_end_address(self, address: int) -> None:
@@ -285,42 +473,79 @@ class ProcessorCIInterface:
         Args:
             address (int): Address at which execution should stop.
         """
-        self._send_command(0x44, address)
+        self._send_command(Opcode.SET_EXECUTION_END_ADDRESS, address)
 
     def set_accumulator_as_end_address(self) -> None:
         """
         Sets the current accumulator value as the execution end address.
         """
-        self._send_command(0x64, 0)
+        self._send_data(_FRAME_SET_ACCUMULATOR_AS_END_ADDRESS)
 
-    def write_from_accumulator(self, n: int, data: list[int]) -> None:
+    def write_from_accumulator(
+        self, n: int, data: Union[list[int], array]
+    ) -> None:
         """
         Writes multiple values from the accumulator to memory.
 
         Args:
             n (int): Number of values to write.
-            data (list[int]): List of data values to write to memory.
+            data (Union[list[int], array]): Data values to write to memory.
+
+        Raises:
+            ValueError: If `data` holds fewer than `n` values.
         """
-        self._send_command(0x65, n)
-        for i in range(n):
-            self.send_rawdata(data[i])
+        if len(data) < n:
+            raise ValueError(
+                f'Expected {n} values, but only {len(data)} were given.'
+            )
+
+        header = _CMD_STRUCT.pack(
+            ((n & 0xFFFFFF) << 8) | Opcode.WRITE_FROM_ACCUMULATOR
+        )
+        if isinstance(data, array) and data.itemsize == 4:
+            payload = data[:n]
+            if sys.byteorder == 'little':
+                payload.byteswap()
+        else:
+            payload = bytearray()
+            for start in range(0, n, _BULK_CHUNK_WORDS):
+                chunk = data[start : min(start + _BULK_CHUNK_WORDS, n)]
+                payload += struct.pack(f'>{len(chunk)}I', *chunk)
+
+        self._writev([header, payload])
 
-    def read_from_accumulator(self, n: int) -> list[int]:
+    def read_from_accumulator(self, n: int) -> array:
         """
         Reads multiple values from memory into the accumulator.
 
+        The reply is received straight into a preallocated `array('I')`, so no
+        intermediate `bytes` object is created per value.
+
         Args:
             n (int): Number of values to read.
 
         Returns:
-            list[int]: List of data values read from memory.
-        """
-        self._send_command(0x62, n)
-        data = []
-        for _ in range(n):
-            data_line = self.read_data()
-            data.append(data_line)
-
+            array: Data values read from memory.
+
+        Raises:
+            TimeoutError: If the processor stops sending before all values
+            are received.
+        """
+        self._send_command(Opcode.READ_FROM_ACCUMULATOR, n)
+        data = array('I', bytes(4 * n))
+        view = memoryview(data).cast('B')
+        received = 0
+        while received < len(view):
+            count = self.serial.readinto(view[received:])
+            if not count:
+                raise TimeoutError(
+                    f'Timed out waiting for {len(view) - received} of '
+                    f'{len(view)} bytes.'
+                )
+            received += count
+
+        if sys.byteorder == 'little':
+            data.byteswap()
         return data
 
     def get_accumulator_value(self) -> int:
@@ -330,14 +555,14 @@ class ProcessorCIInterface:
         Returns:
             int: Value of the accumulator.
         """
-        self._send_command(0x61, 0)
+        self._send_data(_FRAME_GET_ACCUMULATOR_VALUE)
         return self.read_data()
 
     def change_memory_access_priority(self) -> None:
         """
         Changes the priority of memory access operations.
         """
-        self._send_command(0x4F, 0)
+        self._send_data(_FRAME_CHANGE_MEMORY_ACCESS_PRIORITY)
 
     def execute_until_stop(
         self, stop_address: int = -1, exec_timeout: int = -1
@@ -359,12 +584,9 @@ class ProcessorCIInterface:
         if exec_timeout != -1:
             self.set_timeout(exec_timeout)  # Garantia de que o método existe
 
-        self._send_command(0x75, 0)
-
-        while not self.data_available():
-            time.sleep(0.1)
+        self._send_data(_FRAME_EXECUTE_UNTIL_STOP)
 
-        return self.read_data(8)
+        return self._wait_read(8)
 
     def sync(self) -> bytes:
         """
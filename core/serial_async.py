@@ -0,0 +1,456 @@
+"""
+Asynchronous interface for communicating with a processor over serial.
+
+This module contains the `AsyncProcessorCIInterface` class, an `asyncio`
+counterpart of `ProcessorCIInterface`. Commands are written as soon as they
+are submitted and their replies are matched in order, so several requests can
+be in flight at once, e.g.:
+
+    values = await asyncio.gather(
+        interface.read_memory(0x00), interface.read_memory(0x04)
+    )
+"""
+
+import asyncio
+import struct
+import sys
+from array import array
+from typing import Optional, Union
+
+try:
+    import serial_asyncio
+except ImportError as e:
+    raise ImportError(
+        'core.serial_async requires pyserial-asyncio, install it with '
+        "'pip install processor_ci_communication[async]'."
+    ) from e
+
+from core.serial import _CMD_STRUCT, _RAW_STRUCT, Opcode
+
+# Time to wait for a sync reply before sending a second sync byte.
+_SYNC_RETRY_DELAY = 0.1
+
+
+class AsyncProcessorCIInterface:
+    """
+    Asynchronous interface for communication with a processor via serial
+    commands.
+
+    Replies arrive in the same order the commands were sent, so each
+    submission waits for the previous reply to be consumed before reading its
+    own, while the commands themselves are written without waiting. A reply
+    is consumed even if the caller waiting for it is cancelled, so it cannot
+    be taken for the reply of a later request.
+    """
+
+    __slots__ = ('_reader', '_writer', '_last_read')
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Initializes the interface over an already opened serial stream.
+
+        Args:
+            reader (asyncio.StreamReader): Stream used to receive replies.
+            writer (asyncio.StreamWriter): Stream used to send commands.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._last_read: Optional[asyncio.Future] = None
+
+    @classmethod
+    async def open(
+        cls, port: str, baudrate: int
+    ) -> 'AsyncProcessorCIInterface':
+        """
+        Opens the serial port and creates the interface.
+
+        Args:
+            port (str): Serial port to use (e.g., '/dev/ttyUSB0').
+            baudrate (int): Communication speed in baud rate.
+
+        Returns:
+            AsyncProcessorCIInterface: Interface bound to the opened port.
+        """
+        reader, writer = await serial_asyncio.open_serial_connection(
+            url=port, baudrate=baudrate
+        )
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        """
+        Closes the serial connection.
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def _read_after(
+        self, previous: Optional[asyncio.Future], size: int
+    ) -> bytes:
+        """
+        Reads a reply once the reply of the previous submission was consumed.
+
+        Args:
+            previous (Optional[asyncio.Future]): Read of the previous
+            submission, if any.
+            size (int): Number of bytes to read.
+
+        Returns:
+            bytes: Data read from the serial port.
+
+        Raises:
+            ConnectionError: If the previous reply was not received, since the
+            data left in the stream can no longer be matched to its request.
+        """
+        if previous is not None:
+            await asyncio.wait([previous])
+            if previous.cancelled() or previous.exception() is not None:
+                raise ConnectionError(
+                    'An earlier reply was not received, the replies are out '
+                    'of sync.'
+                )
+        return await self._reader.readexactly(size)
+
+    async def submit(self, data: bytes, reply_size: int = 0) -> bytes:
+        """
+        Sends data to the processor and waits for its reply.
+
+        The data is written before the first suspension point, so concurrent
+        submissions reach the processor in the order they were started.
+
+        Args:
+            data (bytes): Frames to be sent.
+            reply_size (int): Number of bytes expected in reply.
+
+        Returns:
+            bytes: Reply data, empty if no reply is expected.
+        """
+        self._writer.write(data)
+        if not reply_size:
+            await self._writer.drain()
+            return b''
+
+        read = asyncio.ensure_future(
+            self._read_after(self._last_read, reply_size)
+        )
+        self._last_read = read
+        await self._writer.drain()
+        return await asyncio.shield(read)
+
+    async def _send_command(
+        self, opcode: int, immediate: int, reply_size: int = 0
+    ) -> bytes:
+        """
+        Sends a command to the processor.
+
+        Args:
+            opcode (int): Operation code.
+            immediate (int): Immediate value to send with the command.
+            reply_size (int): Number of bytes expected in reply.
+
+        Returns:
+            bytes: Reply data, empty if no reply is expected.
+        """
+        return await self.submit(
+            _CMD_STRUCT.pack(((immediate & 0xFFFFFF) << 8) | (opcode & 0xFF)),
+            reply_size,
+        )
+
+    async def send_rawdata(self, data: int) -> None:
+        """
+        Sends raw data to the processor.
+
+        Args:
+            data (int): Data to be sent.
+        """
+        await self.submit(_RAW_STRUCT.pack(data))
+
+    async def send_clk_pulses(self, n: int) -> None:
+        """
+        Sends a specific number of clock pulses to the processor.
+
+        Args:
+            n (int): Number of clock pulses to send.
+        """
+        await self._send_command(Opcode.SEND_CLK, n)
+
+    async def stop_clk(self) -> None:
+        """
+        Stops the processor clock.
+        """
+        await self._send_command(Opcode.STOP_CLK, 0)
+
+    async def resume_clk(self) -> None:
+        """
+        Resumes the processor clock.
+        """
+        await self._send_command(Opcode.RESUME_CLK, 0)
+
+    async def reset_core(self) -> None:
+        """
+        Resets the processor core.
+        """
+        await self._send_command(Opcode.RESET_CORE, 0)
+
+    async def write_memory(
+        self, address: int, value: int, second_memory: bool = False
+    ) -> None:
+        """
+        Writes a value to the processor's memory.
+
+        Args:
+            address (int): Memory address.
+            value (int): Value to write.
+            second_memory (bool): Whether to access the second memory block.
+        """
+        address = address >> 2
+        if second_memory:
+            address = address | 0x800000
+        await self.submit(
+            _CMD_STRUCT.pack(((address & 0xFFFFFF) << 8) | Opcode.WRITE_MEMORY)
+            + _RAW_STRUCT.pack(value)
+        )
+
+    async def read_memory(
+        self, address: int, second_memory: bool = False
+    ) -> bytes:
+        """
+        Reads a value from the processor's memory.
+
+        Args:
+            address (int): Memory address.
+            second_memory (bool): Whether to access the second memory block.
+
+        Returns:
+            bytes: Value read from memory.
+        """
+        address = address >> 2
+        if second_memory:
+            address = address & 0xFFFFFF
+            address = address | 0x800000
+        return await self._send_command(Opcode.READ_MEMORY, address, 4)
+
+    async def load_msb_accumulator(self, value: int) -> None:
+        """
+        Loads the most significant byte (MSB) into the accumulator.
+
+        Args:
+            value (int): Value to load into the MSB of the accumulator.
+        """
+        await self._send_command(Opcode.LOAD_MSB_ACCUMULATOR, value)
+
+    async def load_lsb_accumulator(self, value: int) -> None:
+        """
+        Loads the least significant byte (LSB) into the accumulator.
+
+        Args:
+            value (int): Value to load into the LSB of the accumulator.
+        """
+        await self._send_command(Opcode.LOAD_LSB_ACCUMULATOR, value & 0xFF)
+
+    async def add_to_accumulator(self, value: int) -> None:
+        """
+        Adds a value to the current accumulator value.
+
+        Args:
+            value (int): Value to add to the accumulator.
+        """
+        await self._send_command(Opcode.ADD_TO_ACCUMULATOR, value)
+
+    async def write_accumulator_to_memory(self, address: int) -> None:
+        """
+        Writes the accumulator value to a specific memory address.
+
+        Args:
+            address (int): Memory address where the accumulator value will be
+            written.
+        """
+        await self._send_command(Opcode.WRITE_ACCUMULATOR_TO_MEMORY, address)
+
+    async def write_to_accumulator(self, value: int) -> None:
+        """
+        Writes a value directly into the accumulator.
+
+        Args:
+            value (int): Value to write into the accumulator.
+        """
+        await self._send_command(Opcode.WRITE_TO_ACCUMULATOR, value)
+
+    async def read_accumulator(self) -> bytes:
+        """
+        Reads the current value stored in the accumulator.
+
+        Returns:
+            bytes: Value of the accumulator.
+        """
+        return await self._send_command(Opcode.READ_ACCUMULATOR, 0, 4)
+
+    async def get_accumulator_value(self) -> bytes:
+        """
+        Retrieves the current value stored in the accumulator.
+
+        Returns:
+            bytes: Value of the accumulator.
+        """
+        return await self._send_command(Opcode.GET_ACCUMULATOR_VALUE, 0, 4)
+
+    async def set_timeout(self, timeout: int) -> None:
+        """
+        Sets the timeout duration for processor operations.
+
+        Args:
+            timeout (int): Timeout value in seconds.
+        """
+        await self._send_command(Opcode.SET_TIMEOUT, timeout)
+
+    async def set_memory_page_size(self, size: int) -> None:
+        """
+        Configures the memory page size for the processor.
+
+        Args:
+            size (int): Size of the memory page in bytes.
+        """
+        await self._send_command(Opcode.SET_MEMORY_PAGE_SIZE, size)
+
+    async def set_execution_end_address(self, address: int) -> None:
+        """
+        Sets the end address for execution operations.
+
+        Args:
+            address (int): Address at which execution should stop.
+        """
+        await self._send_command(Opcode.SET_EXECUTION_END_ADDRESS, address)
+
+    async def set_accumulator_as_end_address(self) -> None:
+        """
+        Sets the current accumulator value as the execution end address.
+        """
+        await self._send_command(Opcode.SET_ACCUMULATOR_AS_END_ADDRESS, 0)
+
+    async def get_module_id(self) -> bytes:
+        """
+        Retrieves the module ID of the connected processor.
+
+        Returns:
+            bytes: Module ID as received from the processor.
+        """
+        return await self._send_command(Opcode.GET_MODULE_ID, 0, 4)
+
+    async def write_from_accumulator(
+        self, n: int, data: Union[list[int], array]
+    ) -> None:
+        """
+        Writes multiple values from the accumulator to memory.
+
+        Args:
+            n (int): Number of values to write.
+            data (Union[list[int], array]): Data values to write to memory.
+
+        Raises:
+            ValueError: If `data` holds fewer than `n` values.
+        """
+        if len(data) < n:
+            raise ValueError(
+                f'Expected {n} values, but only {len(data)} were given.'
+            )
+
+        header = _CMD_STRUCT.pack(
+            ((n & 0xFFFFFF) << 8) | Opcode.WRITE_FROM_ACCUMULATOR
+        )
+        if isinstance(data, array) and data.itemsize == 4:
+            payload = data[:n]
+            if sys.byteorder == 'little':
+                payload.byteswap()
+            await self.submit(header + payload.tobytes())
+        else:
+            await self.submit(header + struct.pack(f'>{n}I', *data[:n]))
+
+    async def read_from_accumulator(self, n: int) -> array:
+        """
+        Reads multiple values from memory into the accumulator.
+
+        Args:
+            n (int): Number of values to read.
+
+        Returns:
+            array: Data values read from memory.
+        """
+        reply = await self._send_command(
+            Opcode.READ_FROM_ACCUMULATOR, n, 4 * n
+        )
+        data = array('I', reply)
+        if sys.byteorder == 'little':
+            data.byteswap()
+        return data
+
+    async def change_memory_access_priority(self) -> None:
+        """
+        Changes the priority of memory access operations.
+        """
+        await self._send_command(Opcode.CHANGE_MEMORY_ACCESS_PRIORITY, 0)
+
+    async def run_memory_tests(
+        self,
+        number_of_pages: int = 16,
+        stop_address: int = -1,
+        timeout: int = -1,
+    ) -> bytes:
+        """
+        Runs memory tests on the processor.
+
+        Args:
+            number_of_pages (int): Number of memory pages to test.
+            stop_address (int, optional): Address at which execution should
+            stop. Defaults to -1 (no specific stop address).
+            timeout (int, optional): Timeout duration for the test. Defaults
+            to -1 (no timeout).
+
+        Returns:
+            bytes: Data received as a result of the memory test.
+        """
+        if stop_address != -1:
+            await self.set_execution_end_address(stop_address)
+        if timeout != -1:
+            await self.set_timeout(timeout)
+
+        return await self._send_command(
+            Opcode.RUN_MEMORY_TESTS, number_of_pages, 4
+        )
+
+    async def execute_until_stop(
+        self, stop_address: int = -1, exec_timeout: int = -1
+    ) -> bytes:
+        """
+        Executes the processor until it stops, with optional stop address and
+        timeout.
+
+        Args:
+            stop_address (int): Optional stop address for execution.
+            exec_timeout (int): Optional timeout for execution.
+
+        Returns:
+            bytes: Data received after execution.
+        """
+        if stop_address != -1:
+            await self.set_execution_end_address(stop_address)
+        if exec_timeout != -1:
+            await self.set_timeout(exec_timeout)
+
+        return await self._send_command(Opcode.EXECUTE_UNTIL_STOP, 0, 8)
+
+    async def sync(self) -> bytes:
+        """
+        Synchronizes the interface with the processor.
+
+        A second sync byte is sent if the processor does not answer the first
+        one promptly, as `ProcessorCIInterface.sync` does.
+
+        Returns:
+            bytes: Response data after synchronization.
+        """
+        reply = asyncio.ensure_future(self.submit(b'\x70', 4))
+        done, _ = await asyncio.wait([reply], timeout=_SYNC_RETRY_DELAY)
+        if not done:
+            await self.submit(b'\x70')
+        return await reply
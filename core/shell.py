@@ -15,238 +15,294 @@ Commands include:
 
 
 import cmd
+from itertools import islice
+from typing import Callable, NamedTuple, Optional
+
 from core.serial import ProcessorCIInterface
 from core.file import read_file
 
 
-class ProcessorCIInterfaceShell(cmd.Cmd, ProcessorCIInterface):
-    """
-    Shell interface for interacting with the processor via serial commands.
+class _Command(NamedTuple):
+    """Shell command and the function that implements it."""
 
-    This class provides an interactive shell that allows sending commands to the processor,
-    such as clock control, memory read and write, accumulator manipulation, and more.
-    """
+    method: Callable
+    # Converters for the arguments; the last `optional` ones may be omitted.
+    converters: tuple = ()
+    optional: int = 0
+    print_result: bool = False
+    # Whether `method` belongs to the shell instead of the interface.
+    on_shell: bool = False
 
-    prompt = 'ProcessorCIInterface> '
 
-    def __init__(self, port: str, baudrate: int, timeout: int = 1) -> None:
-        """
-        Initializes the communication interface with the processor and the interactive shell.
+def _hex(value: str) -> int:
+    """Converts a hexadecimal command argument to an integer."""
+    return int(value, 16)
 
-        Args:
-            port (str): Serial port for communication with the processor.
-            baudrate (int): Data transmission rate.
-            timeout (int): Timeout duration for read operations (in seconds).
-        """
-        ProcessorCIInterface.__init__(self, port, baudrate, timeout)
-        cmd.Cmd.__init__(self)
 
-    def do_exit(self, _):
-        """
-        Exits the interactive shell.
+def _flag(value: str) -> bool:
+    """Converts a numeric command argument to a boolean flag."""
+    return bool(int(value))
 
-        Args:
-            _: Unused argument.
-        """
-        return True
 
-    def do_write_clk(self, arg):
-        """
-        Sends clock pulses to the processor.
+def _write_from_input(shell: 'ProcessorCIInterfaceShell', n: int) -> None:
+    """Reads `n` hexadecimal values from the shell input and writes them from
+    the accumulator to memory.
 
-        Args:
-            arg (str): Number of clock pulses to send.
-        """
-        self.send_clk_pulses(int(arg))
+    Args:
+        shell (ProcessorCIInterfaceShell): Shell whose input is read.
+        n (int): Number of values to read and write.
 
-    def do_stop_clk(self, _):
-        """
-        Stops the processor's clock.
-        """
-        self.stop_clk()
+    Raises:
+        ValueError: If the input ends before `n` values are read.
+    """
+    data = [int(line, 16) for line in islice(shell.stdin, n)]
+    if len(data) < n:
+        raise ValueError(
+            f'Expected {n} values, but the input ended after {len(data)}.'
+        )
+    shell.iface.write_from_accumulator(n, data)
+
+
+def _write_file_in_memory(
+    shell: 'ProcessorCIInterfaceShell',
+    path: str,
+    accumulator: Optional[int] = None,
+) -> None:
+    """Writes the contents of a file to memory in a single transfer.
+
+    Args:
+        shell (ProcessorCIInterfaceShell): Shell whose interface is used.
+        path (str): Path to the file to load.
+        accumulator (Optional[int]): Value to add to the accumulator before
+        the transfer, if any.
+    """
+    data, size = read_file(path)
 
-    def do_resume_clk(self, _):
-        """
-        Resumes the processor's clock.
-        """
-        self.resume_clk()
+    with shell.iface.batched():
+        if accumulator is not None:
+            shell.iface.add_to_accumulator(accumulator)
+        shell.iface.write_from_accumulator(size, data)
 
-    def do_reset_core(self, _):
-        """
-        Resets the processor's core.
-        """
-        self.reset_core()
 
-    def do_write_memory(self, arg):
-        """
-        Writes a value to the processor's memory.
+class ProcessorCIInterfaceShell(cmd.Cmd):
+    """
+    Shell interface for interacting with the processor via serial commands.
 
-        Args:
-            arg (str): Address and value to write to memory (in hexadecimal).
-        """
-        arg = arg.split()
-        address, value = arg[0], arg[1]
-        second_memory = False
-        if len(arg) > 2:
-            second_memory = bool(int(arg[1]))
-        self.write_memory(int(address, 16), int(value, 16), second_memory)
-
-    def do_read_memory(self, arg):
-        """
-        Reads a value from the processor's memory.
+    This class provides an interactive shell that allows sending commands to the processor,
+    such as clock control, memory read and write, accumulator manipulation, and more.
+    """
 
-        Args:
-            arg (str): Memory address to read from (in hexadecimal).
-        """
-        arg = arg.split()
-        second_memory = False
-        address = int(arg[0], 16)
-        if len(arg) > 1:
-            second_memory = bool(int(arg[1]))
-        self.print_data(self.read_memory(address, second_memory))
-
-    def do_load_msb_accumulator(self, arg):
-        """
-        Loads the Most Significant Byte (MSB) into the accumulator.
+    prompt = 'ProcessorCIInterface> '
 
-        Args:
-            arg (str): Value to load into the MSB (in hexadecimal).
-        """
-        self.load_msb_accumulator(int(arg, 16))
+    # Single source of argument parsing for interactive commands and scripts.
+    _CMD_TABLE = {
+        'write_clk': _Command(ProcessorCIInterface.send_clk_pulses, (int,)),
+        'stop_clk': _Command(ProcessorCIInterface.stop_clk),
+        'resume_clk': _Command(ProcessorCIInterface.resume_clk),
+        'reset_core': _Command(ProcessorCIInterface.reset_core),
+        'write_memory': _Command(
+            ProcessorCIInterface.write_memory, (_hex, _hex, _flag), optional=1
+        ),
+        'read_memory': _Command(
+            ProcessorCIInterface.read_memory,
+            (_hex, _flag),
+            optional=1,
+            print_result=True,
+        ),
+        'load_msb_accumulator': _Command(
+            ProcessorCIInterface.load_msb_accumulator, (_hex,)
+        ),
+        'load_lsb_accumulator': _Command(
+            ProcessorCIInterface.load_lsb_accumulator, (_hex,)
+        ),
+        'add_to_accumulator': _Command(
+            ProcessorCIInterface.add_to_accumulator, (_hex,)
+        ),
+        'write_accumulator_to_memory': _Command(
+            ProcessorCIInterface.write_accumulator_to_memory, (_hex,)
+        ),
+        'write_to_accumulator': _Command(
+            ProcessorCIInterface.write_to_accumulator, (_hex,)
+        ),
+        'set_timeout': _Command(ProcessorCIInterface.set_timeout, (int,)),
+        'set_memory_page_size': _Command(
+            ProcessorCIInterface.set_memory_page_size, (int,)
+        ),
+        'run_memory_tests': _Command(
+            ProcessorCIInterface.run_memory_tests, (int,)
+        ),
+        'get_module_id': _Command(
+            ProcessorCIInterface.get_module_id, print_result=True
+        ),
+        'set_breakpoint': _Command(
+            ProcessorCIInterface.set_execution_end_address, (_hex,)
+        ),
+        'set_accumulator_as_breakpoint': _Command(
+            ProcessorCIInterface.set_accumulator_as_end_address
+        ),
+        'write_from_accumulator': _Command(
+            _write_from_input, (int,), on_shell=True
+        ),
+        'read_accumulator': _Command(
+            ProcessorCIInterface.get_accumulator_value, print_result=True
+        ),
+        'swap_memory_to_core': _Command(
+            ProcessorCIInterface.change_memory_access_priority
+        ),
+        'until': _Command(ProcessorCIInterface.execute_until_stop),
+        'sync': _Command(ProcessorCIInterface.sync, print_result=True),
+        'write_file_in_memory': _Command(
+            _write_file_in_memory,
+            (str, _hex),
+            optional=1,
+            on_shell=True,
+        ),
+    }
 
-    def do_load_lsb_accumulator(self, arg):
+    def __init__(self, port: str, baudrate: int, timeout: int = 1) -> None:
         """
-        Loads the Least Significant Byte (LSB) into the accumulator.
+        Initializes the communication interface with the processor and the interactive shell.
 
         Args:
-            arg (str): Value to load into the LSB (in hexadecimal).
-        """
-        self.load_lsb_accumulator(int(arg, 16))
-
-    def do_add_to_accumulator(self, arg):
+            port (str): Serial port for communication with the processor.
+            baudrate (int): Data transmission rate.
+            timeout (int): Timeout duration for read operations (in seconds).
         """
-        Adds a value to the accumulator.
+        super().__init__()
+        self.iface = ProcessorCIInterface(port, baudrate, timeout)
 
-        Args:
-            arg (str): Value to add to the accumulator (in hexadecimal).
+    def onecmd(self, line: str) -> bool:
         """
-        self.add_to_accumulator(int(arg, 16))
+        Interprets a command line through the command table.
 
-    def do_write_accumulator_to_memory(self, arg):
-        """
-        Writes the accumulator's value to memory.
+        Invalid arguments are reported without leaving the shell. Lines that
+        do not start with a command of the table (empty lines, `help`, `exit`,
+        unknown commands) are handled by `cmd.Cmd.onecmd`.
 
         Args:
-            arg (str): Memory address where the accumulator will be written (in hexadecimal).
-        """
-        self.write_accumulator_to_memory(int(arg, 16))
+            line (str): Command line to execute.
 
-    def do_write_to_accumulator(self, arg):
+        Returns:
+            bool: `True` if the shell should stop.
         """
-        Directly writes a value to the accumulator.
+        name, *args = line.split() or ('',)
+        if name not in self._CMD_TABLE:
+            return super().onecmd(line)
 
-        Args:
-            arg (str): Value to write to the accumulator (in hexadecimal).
-        """
-        self.write_to_accumulator(int(arg, 16))
+        self.lastcmd = line
+        try:
+            self._run(*self._parse(name, args))
+        except ValueError as e:
+            print(e)
+        return False
 
-    def do_set_timeout(self, arg):
+    def completenames(self, text: str, *_) -> list[str]:
         """
-        Sets the timeout duration for operations.
+        Completes command names from the command table.
 
         Args:
-            arg (str): Timeout duration in seconds.
-        """
-        self.set_timeout(int(arg))
+            text (str): Prefix typed by the user.
 
-    def do_set_memory_page_size(self, arg):
+        Returns:
+            list[str]: Command names starting with the prefix.
         """
-        Sets the size of memory pages.
+        names = [*self._CMD_TABLE, 'exit', 'help']
+        return [name for name in names if name.startswith(text)]
 
-        Args:
-            arg (str): Memory page size.
+    def _parse(self, name: str, args: list[str]) -> tuple[_Command, list]:
         """
-        self.set_memory_page_size(int(arg))
-
-    def do_run_memory_tests(self, arg):
-        """
-        Runs memory tests.
+        Checks and converts the arguments of a command.
 
         Args:
-            arg (str): Number of pages to test.
-        """
-        self.run_memory_tests(number_of_pages=int(arg))
+            name (str): Command name.
+            args (list[str]): Command arguments.
+
+        Returns:
+            tuple[_Command, list]: The command and its converted arguments.
+
+        Raises:
+            ValueError: If the number of arguments is wrong or an argument
+            cannot be converted.
+        """
+        command = self._CMD_TABLE[name]
+        maximum = len(command.converters)
+        minimum = maximum - command.optional
+        if not minimum <= len(args) <= maximum:
+            expected = (
+                str(maximum)
+                if minimum == maximum
+                else f'{minimum} to {maximum}'
+            )
+            raise ValueError(
+                f"'{name}' takes {expected} argument(s), got {len(args)}."
+            )
 
-    def do_get_module_id(self, _):
-        """
-        Retrieves the processor's module ID.
-        """
-        self.print_data(self.get_module_id())
+        values = [
+            convert(arg) for convert, arg in zip(command.converters, args)
+        ]
+        return command, values
 
-    def do_set_breakpoint(self, arg):
+    def _run(self, command: _Command, values: list) -> None:
         """
-        Sets a breakpoint at the specified address.
+        Runs a parsed command and prints its result if it has one.
 
         Args:
-            arg (str): Address of the breakpoint (in hexadecimal).
+            command (_Command): Command to run.
+            values (list): Converted command arguments.
         """
-        self.set_execution_end_address(int(arg, 16))
+        target = self if command.on_shell else self.iface
+        result = command.method(target, *values)
+        if command.print_result:
+            self.iface.print_data(result)
 
-    def do_set_accumulator_as_breakpoint(self, _):
-        """
-        Sets the accumulator as the breakpoint.
+    def run_script(self, path: str) -> None:
         """
-        self.set_accumulator_as_end_address()
+        Runs the shell commands stored in a file.
 
-    def do_write_from_accumulator(self, arg):
-        """
-        Writes data from the accumulator to memory.
+        The whole file is parsed, including the number of arguments of every
+        command, before anything is sent, so a typo aborts the script without
+        leaving the processor half-configured. Empty lines and lines starting
+        with `#` are ignored, and `exit` ends the script.
 
         Args:
-            arg (str): Number of bytes to write from the accumulator.
-        """
-        data = []
-        for _ in range(int(arg)):
-            data.append(int(input(), 16))
-        self.write_from_accumulator(int(arg), data)
+            path (str): Path to the script file.
 
-    def do_read_accumulator(self):
-        """
-        Reads the current value of the accumulator.
+        Raises:
+            ValueError: If a line holds an unknown command or invalid
+            arguments.
         """
-        self.print_data(self.get_accumulator_value())
+        with open(path, 'r', encoding='utf-8') as file:
+            lines = file.read().splitlines()
 
-    def do_swap_memory_to_core(self):
-        """
-        Swaps the memory access priority with the core.
-        """
-        self.change_memory_access_priority()
+        plan = []
+        for number, line in enumerate(lines, 1):
+            name, *args = line.split() or ('',)
+            if not name or name.startswith('#'):
+                continue
+            if name == 'exit':
+                break
+            if name not in self._CMD_TABLE:
+                raise ValueError(f"Unknown command '{name}' on line {number}.")
 
-    def do_until(self, _):
-        """
-        Executes the processor until the stop condition is met.
-        """
-        self.execute_until_stop()
+            try:
+                plan.append(self._parse(name, args))
+            except ValueError as e:
+                raise ValueError(
+                    f'Invalid command on line {number}: {e}'
+                ) from e
 
-    def do_sync(self, _):
-        """
-        Synchronizes the interface with the processor.
-        """
-        self.print_data(self.sync())
+        for command, values in plan:
+            self._run(command, values)
 
-    def do_write_file_in_memory(self, arg):
+    def do_exit(self, _):
         """
-        Writes the contents of a file directly to the processor's memory.
+        Exits the interactive shell and closes the connection to the processor.
 
         Args:
-            arg (str): Filename to load into memory.
+            _: Unused argument.
         """
-        arg = arg.split()
-        if len(arg) > 1:
-            self.add_to_accumulator(int(arg[1], 16))
-
-        data, size = read_file(arg[0])
-        self.write_from_accumulator(size, data)
+        self.iface.close()
+        return True
 
     def do_help(self, arg):
         """
@@ -257,15 +313,19 @@ class ProcessorCIInterfaceShell(cmd.Cmd, ProcessorCIInterface):
             lists all available commands.
         """
         if arg:
-            try:
-                func = getattr(self, 'do_' + arg)
+            if arg in self._CMD_TABLE:
+                func = self._CMD_TABLE[arg].method
+            else:
+                func = getattr(self, 'do_' + arg, None)
+
+            if func is None:
+                print(f'Command {arg} not found.')
+            else:
                 print(
                     func.__doc__
                     if func.__doc__
                     else f'No help available for {arg}'
                 )
-            except AttributeError:
-                print(f'Command {arg} not found.')
         else:
             print('Available commands:')
             print('exit - Exits the shell.')
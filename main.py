@@ -21,6 +21,7 @@ def main():
     This function processes various command-line arguments to:
     - Set communication parameters such as port, baudrate, and timeout.
     - Optionally start a shell session for interacting with the controller.
+    - Optionally run a file of shell commands on the controller.
     """
     parser = argparse.ArgumentParser()
 
@@ -50,9 +51,21 @@ def main():
         help='Starts a shell for communication with the controller',
         action='store_true',
     )
+    parser.add_argument(
+        '-r',
+        '--script',
+        help='Runs the shell commands stored in a file',
+    )
     args = parser.parse_args()
 
-    if args.shell:
+    if args.script:
+        shell = ProcessorCIInterfaceShell(
+            args.port, args.baudrate, int(args.timeout)
+        )
+        shell.run_script(args.script)
+        shell.iface.close()
+
+    elif args.shell:
         shell = ProcessorCIInterfaceShell(
             args.port, args.baudrate, int(args.timeout)
         )
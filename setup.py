@@ -10,34 +10,57 @@ Dependencies:
     - A requirements.txt file should be present for external dependencies.
 """
 
-from setuptools import setup, find_packages
-
-# Read the contents of README.md and requirements.txt with specified encoding
-with open('README.md', 'r', encoding='utf-8') as readme_file:
-    long_description = readme_file.read()
-
-with open('requirements.txt', 'r', encoding='utf-8') as req_file:
-    install_requires = req_file.read().splitlines()
-
-setup(
-    name='processor_ci_communication',  # Package name
-    version='0.1.0',  # Initial version
-    description='Processor CI Communication Interface',
-    long_description=long_description,
-    long_description_content_type='text/markdown',
-    author='Julio Avelar',
-    author_email='julio.avelar@students.ic.unicamp.br',
-    url='https://github.com/LSC-Unicamp/LSC-Unicamp/processor_ci_communication',  # Repository URL
-    packages=find_packages(),
-    classifiers=[
-        'Programming Language :: Python :: 3',
-        'License :: OSI Approved :: MIT License',
-        'Operating System :: POSIX :: Linux',
-    ],
-    package_data={
-        'core': ['*.py'],  # Include all .py files in the 'core' package
-    },
-    python_requires='>=3.8',
-    include_package_data=True,
-    install_requires=install_requires,
-)
+from pathlib import Path
+
+from setuptools import find_packages, setup
+
+
+def read_long_description() -> str:
+    """Reads the package long description from README.md."""
+    return Path('README.md').read_text(encoding='utf-8')
+
+
+def read_requirements() -> list[str]:
+    """Reads the package dependencies from requirements.txt.
+
+    Blank lines and comments are dropped so setuptools only sees requirement
+    specifiers.
+    """
+    lines = Path('requirements.txt').read_text(encoding='utf-8').splitlines()
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lstrip().startswith('#')
+    ]
+
+
+if __name__ == '__main__':
+    PACKAGES = find_packages(
+        exclude=('tests', 'tests.*', 'build', 'build.*', 'dist')
+    )
+
+    setup(
+        name='processor_ci_communication',  # Package name
+        version='0.1.0',  # Initial version
+        description='Processor CI Communication Interface',
+        long_description=read_long_description(),
+        long_description_content_type='text/markdown',
+        author='Julio Avelar',
+        author_email='julio.avelar@students.ic.unicamp.br',
+        url=(
+            'https://github.com/LSC-Unicamp/LSC-Unicamp/'
+            'processor_ci_communication'
+        ),  # Repository URL
+        packages=PACKAGES,
+        classifiers=[
+            'Programming Language :: Python :: 3',
+            'License :: OSI Approved :: MIT License',
+            'Operating System :: POSIX :: Linux',
+        ],
+        python_requires='>=3.8',
+        include_package_data=True,
+        install_requires=read_requirements(),
+        extras_require={
+            'async': ['pyserial-asyncio==0.6'],
+        },
+    )
@@ -0,0 +1 @@
+"""Tests for the processor_ci_communication package."""
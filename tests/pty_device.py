@@ -0,0 +1,86 @@
+"""
+Pseudo-terminal that stands in for a ProcessorCI controller in tests.
+
+The slave end of the pseudo-terminal is opened as the serial port, while the
+test reads the commands sent to the controller and writes its replies through
+the master end.
+"""
+
+import os
+import pty
+import threading
+import tty
+
+
+class PtyDevice:
+    """
+    Fake controller attached to the master end of a pseudo-terminal.
+
+    Everything written to the port is collected by a background thread, so
+    writers never block on a full terminal buffer.
+    """
+
+    def __init__(self) -> None:
+        """
+        Opens the pseudo-terminal and starts collecting the data sent to it.
+        """
+        self._master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._received = bytearray()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._collect, daemon=True)
+        self._thread.start()
+
+    def _collect(self) -> None:
+        """
+        Stores the data sent to the controller until the port is closed.
+        """
+        while True:
+            try:
+                data = os.read(self._master, 65536)
+            except OSError:
+                return
+            if not data:
+                return
+            with self._condition:
+                self._received += data
+                self._condition.notify_all()
+
+    def receive(self, size: int, timeout: float = 5) -> bytes:
+        """
+        Waits for data sent to the controller.
+
+        Args:
+            size (int): Number of bytes to wait for.
+            timeout (float): Maximum time to wait (in seconds).
+
+        Returns:
+            bytes: Up to `size` bytes, fewer if the timeout expired.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: len(self._received) >= size, timeout
+            )
+            data = bytes(self._received[:size])
+            del self._received[:size]
+        return data
+
+    def send(self, data: bytes) -> None:
+        """
+        Sends a reply from the controller.
+
+        Args:
+            data (bytes): Data to be sent.
+        """
+        os.write(self._master, data)
+
+    def close(self) -> None:
+        """
+        Closes the pseudo-terminal.
+
+        The port opened on the slave end must be closed first.
+        """
+        os.close(self._slave)
+        self._thread.join(5)
+        os.close(self._master)
@@ -0,0 +1,124 @@
+"""
+Tests for the `ProcessorCIInterface` class.
+"""
+
+import errno
+import os
+import struct
+import unittest
+from array import array
+from unittest import mock
+
+import serial
+
+from core.serial import ProcessorCIInterface
+from tests.pty_device import PtyDevice
+
+
+class PtyTestCase(unittest.TestCase):
+    """
+    Test case with an interface connected to a `PtyDevice`.
+    """
+
+    def setUp(self) -> None:
+        """
+        Opens the interface on a new pseudo-terminal.
+        """
+        self.device = PtyDevice()
+        self.addCleanup(self.device.close)
+        self.interface = ProcessorCIInterface(self.device.port, 115200)
+        self.addCleanup(self.interface.close)
+
+
+class BatchedTest(PtyTestCase):
+    """
+    Tests for `ProcessorCIInterface.batched`.
+    """
+
+    def test_flushes_when_the_outermost_block_exits(self) -> None:
+        """
+        Commands queued in nested blocks are sent by the outermost one.
+        """
+        with self.interface.batched():
+            self.interface.stop_clk()
+            with self.interface.batched():
+                self.interface.reset_core()
+            self.assertEqual(self.device.receive(4, timeout=0.2), b'')
+
+        self.assertEqual(
+            self.device.receive(8), bytes.fromhex('00000053 00000052')
+        )
+
+    def test_discards_the_block_that_raises(self) -> None:
+        """
+        Nothing queued in a block that raises is sent.
+        """
+        with self.assertRaises(KeyError):
+            with self.interface.batched():
+                self.interface.stop_clk()
+                raise KeyError
+
+        self.interface.reset_core()
+        self.assertEqual(
+            self.device.receive(8, timeout=0.5), bytes.fromhex('00000052')
+        )
+
+    def test_discards_a_nested_block_caught_by_the_caller(self) -> None:
+        """
+        A nested block that raises leaves nothing behind, even when an
+        enclosing block catches the exception and goes on.
+        """
+        with self.interface.batched():
+            self.interface.stop_clk()
+            with self.assertRaises(KeyError):
+                with self.interface.batched():
+                    self.interface.write_to_accumulator(0x10)
+                    raise KeyError
+            self.interface.reset_core()
+
+        self.assertEqual(
+            self.device.receive(12, timeout=0.5),
+            bytes.fromhex('00000053 00000052'),
+        )
+
+
+@unittest.skipUnless(hasattr(os, 'writev'), 'os.writev is not available')
+class GatherWriteTest(PtyTestCase):
+    """
+    Tests for the `os.writev` path used by bulk transfers.
+    """
+
+    def test_sends_what_a_partial_writev_left_out(self) -> None:
+        """
+        The bytes the kernel did not accept are sent afterwards, in order.
+        """
+        data = array('I', range(1000))
+        write = os.write
+        with mock.patch(
+            'os.writev', lambda fd, buffers: write(fd, bytes(buffers[0])[:3])
+        ):
+            self.interface.write_from_accumulator(len(data), data)
+
+        expected = struct.pack('>1001I', 0x3E865, *data)
+        self.assertEqual(self.device.receive(len(expected)), expected)
+
+    def test_splits_batches_larger_than_iov_max(self) -> None:
+        """
+        A batch with more buffers than `os.writev` accepts is still sent.
+        """
+        with self.interface.batched():
+            for k in range(600):
+                self.interface.write_from_accumulator(1, [k])
+
+        expected = b''.join(struct.pack('>II', 0x165, k) for k in range(600))
+        self.assertEqual(self.device.receive(len(expected)), expected)
+
+    def test_reports_write_errors_as_serial_exceptions(self) -> None:
+        """
+        Errors of `os.writev` are raised like those of `serial.write`.
+        """
+        with mock.patch(
+            'os.writev', side_effect=OSError(errno.EIO, 'I/O error')
+        ):
+            with self.assertRaises(serial.SerialException):
+                self.interface.write_from_accumulator(1, [0])
@@ -0,0 +1,59 @@
+"""
+Tests for the `AsyncProcessorCIInterface` class.
+"""
+
+import asyncio
+import unittest
+
+from tests.pty_device import PtyDevice
+
+try:
+    from core.serial_async import AsyncProcessorCIInterface
+except ImportError as e:
+    raise unittest.SkipTest(str(e)) from e
+
+
+class AsyncProcessorCIInterfaceTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for `AsyncProcessorCIInterface` connected to a `PtyDevice`.
+    """
+
+    async def asyncSetUp(self) -> None:
+        """
+        Opens the interface on a new pseudo-terminal.
+        """
+        self.device = PtyDevice()
+        self.addCleanup(self.device.close)
+        self.interface = await AsyncProcessorCIInterface.open(
+            self.device.port, 115200
+        )
+        self.addAsyncCleanup(self.interface.close)
+
+    async def test_replies_are_matched_in_order(self) -> None:
+        """
+        Concurrent requests get their own replies.
+        """
+        replies = asyncio.gather(
+            self.interface.read_memory(0x08), self.interface.read_memory(0x0C)
+        )
+        self.device.send(b'XXXXYYYY')
+
+        self.assertEqual(await replies, [b'XXXX', b'YYYY'])
+        self.assertEqual(
+            self.device.receive(8), bytes.fromhex('0000024C 0000034C')
+        )
+
+    async def test_cancelled_request_still_consumes_its_reply(self) -> None:
+        """
+        A request cancelled while waiting for its reply does not shift the
+        replies of the requests sent after it.
+        """
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.interface.read_memory(0x08), 0.05)
+        second = asyncio.ensure_future(self.interface.read_memory(0x0C))
+        self.device.send(b'XXXXYYYY')
+        self.assertEqual(await second, b'YYYY')
+
+        sync = asyncio.ensure_future(self.interface.sync())
+        self.device.send(b'ZZZZ')
+        self.assertEqual(await sync, b'ZZZZ')
@@ -0,0 +1,72 @@
+"""
+Tests for the `ProcessorCIInterfaceShell` class.
+"""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from core.shell import ProcessorCIInterfaceShell
+from tests.pty_device import PtyDevice
+
+
+class ProcessorCIInterfaceShellTest(unittest.TestCase):
+    """
+    Tests for `ProcessorCIInterfaceShell` connected to a `PtyDevice`.
+    """
+
+    def setUp(self) -> None:
+        """
+        Opens the shell on a new pseudo-terminal.
+        """
+        self.device = PtyDevice()
+        self.addCleanup(self.device.close)
+        self.shell = ProcessorCIInterfaceShell(self.device.port, 115200)
+        self.addCleanup(self.shell.iface.close)
+
+    def run_script(self, script: str) -> None:
+        """
+        Runs a script through the shell.
+
+        Args:
+            script (str): Contents of the script file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'script.txt'
+            path.write_text(script, encoding='utf-8')
+            self.shell.run_script(str(path))
+
+    def test_script_runs_until_exit(self) -> None:
+        """
+        Comments and empty lines are skipped and `exit` ends the script.
+        """
+        self.run_script('stop_clk\n# comment\n\nwrite_memory 10 0 1\nexit\n')
+
+        self.assertEqual(
+            self.device.receive(16, timeout=0.5),
+            bytes.fromhex('00000053 80000457 00000000'),
+        )
+
+    def test_invalid_script_sends_nothing(self) -> None:
+        """
+        A script with a wrong number of arguments is rejected before any of
+        its commands is sent.
+        """
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            self.run_script('stop_clk\nwrite_memory 10\n')
+
+        self.assertEqual(self.device.receive(4, timeout=0.2), b'')
+
+    def test_invalid_command_keeps_the_shell_open(self) -> None:
+        """
+        Invalid arguments typed in the shell are reported, not raised.
+        """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            stop = self.shell.onecmd('until 1')
+
+        self.assertFalse(stop)
+        self.assertIn("'until' takes 0 argument(s), got 1.", output.getvalue())
+        self.assertEqual(self.device.receive(4, timeout=0.2), b'')